@@ -1,1046 +1,1508 @@
-import os
-import time
-import json
-import shutil
-import requests
-import webbrowser
-from datetime import datetime, timezone
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from tqdm import tqdm
-
-# ==================== #
-#     User Config      #
-# ==================== #
-
-API_BASE = "https://api.real-debrid.com/rest/1.0"
-REQUEST_TIMEOUT = 10 # timeout for all API calls
-MAX_RETRIES = 3 # retries for file processes
-PAGE_LIMIT = 250 # RD Torrents per 'page' - max 500 recommended by RD
-DOWNLOAD_DIR = "Downloaded Files"
-PROCESSED_DIR = "Processed Files"
-UNRESTRICT_RETRIES = 2 # number of attempts to generate download links
-UNRESTRICT_DELAY = 5  # seconds between retries
-MAX_PARALLEL_DOWNLOADS = 4 # max 4 recommended by RD
-CHECK_PREMIUM = True # start with a account check
-
-# === Load API Key === #
-try:
-    with open("config.json") as f:
-        config = json.load(f)
-        TOKEN = config["REAL_DEBRID_API_TOKEN"]
-except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
-    print(f"❌ Failed to load config.json: {e}")
-    exit(1)
-
-# ---------------------------
-# Utilities
-# ---------------------------
-
-def rd_request(method, endpoint, **kwargs):
-    headers = {"Authorization": f"Bearer {TOKEN}"}
-    url = f"{API_BASE}/{endpoint.lstrip('/')}"
-    resp = requests.request(method, url, headers=headers, timeout=REQUEST_TIMEOUT, **kwargs)
-    resp.raise_for_status()
-    return resp.json()
-
-def retry_request(func, retries=MAX_RETRIES, delay=2, *args, **kwargs):
-    for attempt in range(1, retries + 1):
-        try:
-            return func(*args, **kwargs)
-        except requests.RequestException as e:
-            print(f"⚠️ Attempt {attempt} failed: {e}")
-            if attempt < retries:
-                print(f"⏳ Retrying in {delay} seconds...")
-                time.sleep(delay)
-    return None
-
-def prompt_limit(prompt="Type how many torrents to check, or leave blank for all (default): "):
-    while True:
-        choice = input(prompt).strip()
-        if choice == "":
-            return None
-        if choice.isdigit() and int(choice) > 0:
-            return int(choice)
-        print("❌ Invalid input. Please enter a positive number or leave blank for all.")
-
-def check_user_info():
-    try:
-        resp = requests.get(
-            f"{API_BASE}/user",
-            headers={"Authorization": f"Bearer {TOKEN}"},
-            timeout=REQUEST_TIMEOUT
-        )
-        if resp.status_code == 200:
-            user = resp.json()
-            status = "✅ Premium" if user.get("premium") else "❌ Non-premium"
-            expiration = user.get("expiration")
-            if expiration:
-                try:
-                    exp_date = datetime.strptime(expiration, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
-                    days_left = (exp_date - datetime.now(timezone.utc)).days
-                    print(f"{status} — expires in {days_left} day(s)")
-                except ValueError:
-                    print(f"{status} — expiration date format error: {expiration}")
-            else:
-                print(f"{status}")
-        else:
-            print("⚠️ Failed to retrieve user info.")
-    except requests.RequestException as e:
-        print(f"⚠️ Error getting user info: {e}")
-
-
-# ---------------------------
-# Shared Helpers
-# ---------------------------
-
-
-def format_size(num):
-    if num is None:
-        return "unknown size"
-    try:
-        b = int(num)
-    except Exception:
-        return "unknown size"
-    if b >= 1 << 30:
-        return f"{b / (1 << 30):.2f} GB"
-    if b >= 1 << 20:
-        return f"{b / (1 << 20):.2f} MB"
-    if b >= 1 << 10:
-        return f"{b / (1 << 10):.2f} KB"
-    return f"{b} B"
-
-def format_speed(bytes_per_sec):
-    if bytes_per_sec is None:
-        return "0.00MB/s"
-    mbps = bytes_per_sec / (1024 * 1024)
-    return f"{mbps:.2f}MB/s"
-
-def resolve_filename_collision(directory, filename):
-    base, ext = os.path.splitext(filename)
-    candidate = filename
-    i = 1
-    while os.path.exists(os.path.join(directory, candidate)):
-        candidate = f"{base} ({i}){ext}"
-        i += 1
-    return candidate
-
-def open_url(url):
-    try:
-        webbrowser.open(url)
-        print("✅ URL opened in your default browser.")
-    except Exception as e:
-        print(f"⚠️ Failed to open browser: {e}")
-
-def parse_selection(selection_input, max_index):
-    selection = set()
-    invalid_parts = []
-
-    for part in selection_input.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        if '-' in part:
-            try:
-                start, end = map(int, part.split('-'))
-                if 1 <= start <= end <= max_index:
-                    selection.update(range(start, end + 1))
-                else:
-                    invalid_parts.append(part)
-            except ValueError:
-                invalid_parts.append(part)
-        elif part.isdigit():
-            idx = int(part)
-            if 1 <= idx <= max_index:
-                selection.add(idx)
-            else:
-                invalid_parts.append(part)
-        else:
-            invalid_parts.append(part)
-
-    if invalid_parts:
-        print(f"⚠️ Ignored invalid parts: {', '.join(invalid_parts)}")
-
-    return sorted(selection)
-
-def delete_torrent(tid):
-    try:
-        resp = requests.delete(f"{API_BASE}/torrents/delete/{tid}",
-                               headers={"Authorization": f"Bearer {TOKEN}"},
-                               timeout=REQUEST_TIMEOUT)
-        if resp.status_code == 204:
-            print(f"🗑️ Deleted torrent ID: {tid}")
-            return True
-        print(f"⚠️ Failed to delete torrent ID {tid}: Status {resp.status_code}")
-    except requests.RequestException as e:
-        print(f"⚠️ Exception deleting torrent ID {tid}: {e}")
-    return False
-
-def fetch_torrents(limit=None, filter=None):
-    all_torrents = []
-    page = 1
-    headers = {"Authorization": f"Bearer {TOKEN}"}
-
-    print(f"🔄 Retrieving {'last ' + str(limit) if limit else 'all'} torrents...\n")
-
-    while True:
-        try:
-            resp = requests.get(
-                f"{API_BASE}/torrents",
-                params={"page": page, "limit": PAGE_LIMIT},
-                headers=headers,
-                timeout=REQUEST_TIMEOUT
-            )
-            resp.raise_for_status()
-            torrents = resp.json()
-            total_count = int(resp.headers.get("X-Total-Count", "0"))
-        except requests.RequestException as e:
-            print(f"⚠️ Error fetching torrents page {page}: {e}")
-            break
-
-        if not torrents:
-            break
-
-        all_torrents.extend(torrents)
-
-        # stop if we've reached the user-defined limit
-        if limit is not None and len(all_torrents) >= limit:
-            all_torrents = all_torrents[:limit]
-            break
-
-        # stop if we've fetched all pages
-        total_pages = (total_count + PAGE_LIMIT - 1) // PAGE_LIMIT if total_count else 0
-        if page >= total_pages:
-            break
-        
-        print(f"📄 Found {len(torrents)} torrents on page {page}")
-
-        page += 1
-
-    if filter == 'inprogress':
-        filtered = [t for t in all_torrents if t.get("status") != "downloaded"]
-        print(f"✅ Checked {len(all_torrents)} torrents — found {len(filtered)} in-progress.\n")
-        return filtered
-
-    print(f"✅ Found {len(all_torrents)} torrents in total.\n")
-    return all_torrents
-
-
-# ---------------------------
-# Downloader Function
-# ---------------------------
-def torrent_downloader():
-    # 1 How many torrents to fetch
-    while True:
-        choice = input("Type how many torrents to check, or leave blank for default (100): ").strip().lower()
-        if choice == "":
-            limit = 100  # last 100 default
-            break
-        elif choice.isdigit() and int(choice) > 0:
-            limit = int(choice)
-            break
-        else:
-            print("❌ Invalid input. Please enter a positive number or leave blank for all.")
-
-    # 2 Skip non-downloaded?
-    
-    while True:
-        choice = input("Skip non-downloaded torrents? [Y/n] (default Y): ").strip().lower()
-
-        if choice in ("", "y", "yes"):
-            skip_non_downloaded = True
-            print("Skipping non-completed torrents")
-            break
-        elif choice in ("n", "no"):
-            skip_non_downloaded = False
-            print("Non-completed torrents will be shown with status, download links can't be generated for these files")
-            break
-        else:
-            print("❌ Invalid input. Please select Y, y, N, or n.")
-
-
-    # 3 Fetch torrents
-    torrents = fetch_torrents(limit=limit)
-    if not torrents:
-        print("No torrents found in your Real-Debrid account.")
-        return
-
-    # 4 Filter out non completed torrents
-    if skip_non_downloaded:
-        torrents = [t for t in torrents if t.get("status") == "downloaded"]
-
-    if not torrents:
-        print("No eligible torrents found.")
-        return
-
-    # 5 Show avaliable torrents
-    print("\nAvailable torrents:\n")
-    for idx, t in enumerate(torrents, 1):
-        size_str = format_size(t.get("bytes"))
-        status = t.get("status", "").lower()
-        if status == "downloaded":
-            print(f"{idx}: {t.get('filename')} ({size_str})")
-        else:
-            print(f"{idx}: {t.get('filename')} ({size_str}) - Status: {status}")
-
-    # 6 Select torrents (supports ranges and multiple selections)
-    sel = input("\nSelect torrents by number (comma separated, ranges allowed, or 0 for all): ").strip()
-    if sel == "0" or sel == "":
-        selected = torrents
-    else:
-        indices = parse_selection(sel, len(torrents))
-        selected = [torrents[i - 1] for i in indices]
-
-    if not selected:
-        print("⚠️ No torrents selected.")
-        return
-
-    # 7 Generate download links
-    all_files = []
-    file_map = []  # keep track of files with numbering
-    for t in selected:
-        print(f"\nGenerating download links for {t['filename']}...")
-        files = unrestrict_torrent_links(t['id'])
-        if not files:
-            print("⚠️ No files found or failed to generate links.")
-            continue
-        for f in files:
-            file_map.append(f)
-            print(f"{len(file_map)} - {f['filename']} ({format_size(f['filesize'])})")
-        all_files.extend(files)
-
-    if not all_files:
-        print("⚠️ No unrestricted links could be generated.")
-        return
-
-    # 8 File selection (auto-select if only one file)
-    if len(file_map) == 1:
-        selected_files = file_map
-        f = file_map[0]
-        print(f"\n✅ Auto selected single file torrent: {f['filename']} ({format_size(f['filesize'])})")
-    else:
-        sel_files = input(
-            "\nSelect files to download (comma separated, ranges allowed, or 0 for all): "
-        ).strip()
-
-        if sel_files == "0" or sel_files == "":
-            selected_files = file_map
-        else:
-            indices = parse_selection(sel_files, len(file_map))
-            selected_files = [file_map[i - 1] for i in indices]
-
-        if not selected_files:
-            print("⚠️ No files selected.")
-            return
-
-
-    # 9 Parallel download prompt
-    if len(selected_files) > 1:
-        parallel_choice = input("Download files in parallel? (y/N): ").strip().lower()
-        if parallel_choice == "y":
-            while True:
-                try:
-                    num_workers = int(input(f"How many files to download at once? (1-{min(MAX_PARALLEL_DOWNLOADS,len(selected_files))}): "))
-                    if 1 <= num_workers <= min(MAX_PARALLEL_DOWNLOADS,len(selected_files)):
-                        break
-                except ValueError:
-                    continue
-
-            with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                futures = []
-                for pos, f in enumerate(selected_files):
-                    futures.append(executor.submit(download_file, f["download"], f["filename"], pos))
-                for future in as_completed(futures):
-                    future.result()
-            return
-
-    # 10 Run downloads
-    for f in selected_files:
-        download_file(f["download"], f["filename"])
-
-def unrestrict_torrent_links(torrent_id, max_retries=UNRESTRICT_RETRIES, delay=UNRESTRICT_DELAY):
-    """
-    Process to generate download links, catches HTTP errors with retries.
-    """
-    try:
-        info = rd_request("GET", f"torrents/info/{torrent_id}")
-    except requests.RequestException as e:
-        print(f"⚠️ Failed to fetch torrent info for ID {torrent_id}: {e}")
-        return []
-
-    if "links" not in info or not info["links"]:
-        return []
-
-    unrestricted = []
-    for raw_link in info["links"]:
-        for attempt in range(1, max_retries + 1):
-            try:
-                result = rd_request("POST", "unrestrict/link", data={"link": raw_link})
-                unrestricted.append({
-                    "filename": result.get("filename"),
-                    "download": result.get("download"),
-                    "filesize": result.get("filesize"),
-                })
-                break  # success, move to next link
-            except requests.RequestException as e:
-                print(f"⚠️ Attempt {attempt} failed to unrestrict link: {e}")
-                if attempt < max_retries:
-                    print(f"⏳ Retrying in {delay} seconds...")
-                    time.sleep(delay)
-                else:
-                    print("❌ Skipping this link due to repeated failures.")
-    return unrestricted
-
-def download_file(url, filename, position=0):
-    os.makedirs(DOWNLOAD_DIR, exist_ok=True)
-    filename = resolve_filename_collision(DOWNLOAD_DIR, filename)
-    filepath = os.path.join(DOWNLOAD_DIR, filename)
-
-    pbar = None
-
-    try:
-        for attempt in range(1, MAX_RETRIES + 1):
-            try:
-                with requests.get(url, stream=True, timeout=REQUEST_TIMEOUT) as resp:
-                    resp.raise_for_status()
-                    total_size = int(resp.headers.get("Content-Length", 0))
-                    chunk_size = 8192
-
-                    # Create tqdm ONCE
-                    if pbar is None:
-                        pbar = tqdm(
-                            total=total_size,
-                            unit="B",
-                            unit_scale=True,
-                            desc=filename,
-                            position=position,
-                            leave=False,
-                            dynamic_ncols=True,
-                            bar_format="{percentage:3.0f}% {n_fmt}/{total_fmt} @ {rate_fmt}"
-                        )
-
-                    with open(filepath, "wb") as f:
-                        for chunk in resp.iter_content(chunk_size=chunk_size):
-                            if chunk:
-                                f.write(chunk)
-                                pbar.update(len(chunk))
-
-                tqdm.write(f"✅ Downloaded: {filename}")
-                return True
-
-            except requests.RequestException as e:
-                if pbar:
-                    pbar.reset()
-                tqdm.write(f"⚠️ Download attempt {attempt} failed for '{filename}': {e}")
-                time.sleep(2)
-
-        tqdm.write(f"❌ Failed to download: {filename}")
-        return False
-
-    except KeyboardInterrupt:
-        tqdm.write("⚠️ Download interrupted by user.")
-        return False
-
-    finally:
-        if pbar:
-            pbar.close()
-
-
-
-# ---------------------------
-# Hosted Links Converter
-# ---------------------------
-
-def hoster_downloader():
-#Handles direct hosted links added to links.txt, basic catching for single file or folders 
-
-    # 1. Optional host status check
-    check_status = input("Check host status first? [y/N] (default N): ").strip().lower()
-    if check_status in ("y", "yes"):
-        try:
-            status = rd_request("GET", "hosts/status")
-            
-            only_online = input("Only show online hosts? [Y/n] (default Y): ").strip().lower()
-            show_only_online = only_online in ("", "y", "yes")
-            
-            print("\n=== Host Status ===")
-            for host, info in status.items():
-                is_online = info.get("supported") and info.get("status") == "up"
-                
-                if show_only_online and not is_online:
-                    continue  # skip offline hosts
-                
-                line = f"{host:20} - "
-                if is_online:
-                    line += "✅ Online"
-                else:
-                    line += "❌ Offline/Unsupported"
-                print(line)
-            print()
-            
-        except requests.RequestException as e:
-            print(f"⚠️ Failed to fetch host status: {e}")
-
-    # 2. Load links.txt file (case-insensitive)
-    links_file = None
-    for f in os.listdir():
-        if f.lower() == "links.txt":
-            links_file = f
-            break
-
-    if not links_file:
-        print("❌ No 'links.txt' file found in current directory.")
-        return
-
-    with open(links_file, "r", encoding="utf-8") as f:
-        raw_links = [line.strip() for line in f if line.strip()]
-
-    if not raw_links:
-        print("❌ 'links.txt' file is empty.")
-        return
-
-    print(f"\n📄 Found {len(raw_links)} links in '{links_file}'.\n")
-
-    # 3. Unrestrict each link
-    unrestricted = []
-    for link in raw_links:
-        try:
-            print(f"\n🔄 Processing {link}\n")
-            processed = False
-
-            # 3a. Basic check if link is a folder, (mega has folder in URL, not sure about other hosts)
-            if "folder" in link.lower():
-                try:
-                    result = rd_request("POST", "unrestrict/folder", data={"link": link})
-                    if result:
-                        for file_info in result:
-                            if isinstance(file_info, dict):
-                                filename = file_info.get("filename", "Unknown")
-                                download = file_info.get("download")
-                                filesize = file_info.get("filesize")
-                                # Try to unrestrict if download is missing
-                                if not download and "link" in file_info:
-                                    try:
-                                        dl = rd_request("POST", "unrestrict/link", data={"link": file_info["link"]})
-                                        download = dl.get("download")
-                                        filesize = dl.get("filesize", filesize)
-                                        filename = dl.get("filename", filename)
-                                    except requests.RequestException:
-                                        print(f"⚠️ Failed to unrestrict individual file: {filename}")
-                            elif isinstance(file_info, str):
-                                filename = file_info
-                                download = None
-                                filesize = None
-                                # Try to unrestrict the string as a link
-                                try:
-                                    dl = rd_request("POST", "unrestrict/link", data={"link": file_info})
-                                    filename = dl.get("filename", filename)
-                                    download = dl.get("download")
-                                    filesize = dl.get("filesize", filesize)
-                                except requests.RequestException:
-                                    print(f"⚠️ Failed to unrestrict file: {filename}")
-                            else:
-                                continue
-
-                            unrestricted.append({
-                                "filename": filename,
-                                "download": download,
-                                "filesize": filesize,
-                            })
-
-                            size_str = f" ({format_size(filesize)})" if filesize else ""
-                            print(f"✅ Folder file: {filename}{size_str}")
-
-                        processed = True
-                    else:
-                        print(f"⚠️ No files found in folder: {link}")
-                        processed = True
-                except requests.RequestException:
-                    pass  # fallback to single-file if folder fails
-
-            # 3b. Single-file unrestrict if not processed
-            if not processed:
-                try:
-                    result = rd_request("POST", "unrestrict/link", data={"link": link})
-                    filename = result.get("filename", link)
-                    download = result.get("download")
-                    filesize = result.get("filesize")
-                    unrestricted.append({
-                        "filename": filename,
-                        "download": download,
-                        "filesize": filesize,
-                    })
-                    size_str = f" ({format_size(filesize)})" if filesize else ""
-                    print(f"✅ Processed: {filename}{size_str}")
-                    processed = True
-                except requests.RequestException:
-                    # fallback to folder method
-                    try:
-                        result = rd_request("POST", "unrestrict/folder", data={"link": link})
-                        if result:
-                            for file_info in result:
-                                if isinstance(file_info, dict):
-                                    filename = file_info.get("filename", "Unknown")
-                                    download = file_info.get("download")
-                                    filesize = file_info.get("filesize")
-                                    if not download and "link" in file_info:
-                                        try:
-                                            dl = rd_request("POST", "unrestrict/link", data={"link": file_info["link"]})
-                                            download = dl.get("download")
-                                            filesize = dl.get("filesize", filesize)
-                                            filename = dl.get("filename", filename)
-                                        except requests.RequestException:
-                                            print(f"⚠️ Failed to unrestrict individual file: {filename}")
-                                elif isinstance(file_info, str):
-                                    filename = file_info
-                                    download = None
-                                    filesize = None
-                                    try:
-                                        dl = rd_request("POST", "unrestrict/link", data={"link": file_info})
-                                        filename = dl.get("filename", filename)
-                                        download = dl.get("download")
-                                        filesize = dl.get("filesize", filesize)
-                                    except requests.RequestException:
-                                        print(f"⚠️ Failed to unrestrict file: {filename}")
-                                else:
-                                    continue
-
-                                unrestricted.append({
-                                    "filename": filename,
-                                    "download": download,
-                                    "filesize": filesize,
-                                })
-                                size_str = f" ({format_size(filesize)})" if filesize else ""
-                                print(f"✅ Folder file (fallback): {filename}{size_str}")
-
-                            processed = True
-                        else:
-                            print(f"❌ Could not process link: {link}")
-                    except requests.RequestException:
-                        print(f"❌ Could not process link at all: {link}")
-
-        except Exception as e:
-            print(f"⚠️ Unexpected error processing {link}: {e}")
-
-    if not unrestricted:
-        print("❌ No valid unrestricted links were generated.")
-        return
-
-    # 4. Let user pick files to download
-    print("\nAvailable files:\n")
-    for idx, f in enumerate(unrestricted, 1):
-        size_str = f" ({format_size(f['filesize'])})" if f['filesize'] else ""
-        print(f"{idx}: {f['filename']}{size_str}")
-    print("\n0: Download all files")
-
-    sel = input("\nSelect files by number (comma separated, ranges allowed, or 0 for all): ").strip()
-    if sel in ("", "0"):
-        selected = unrestricted
-    else:
-        indices = parse_selection(sel, len(unrestricted))
-        selected = [unrestricted[i - 1] for i in indices]
-
-    if not selected:
-        print("⚠️ No files selected.")
-        return
-
-    # 5. Filter out files with no download URL
-    selected_valid = []
-    for f in selected:
-        if f.get("download"):
-            selected_valid.append(f)
-        else:
-            print(f"⚠️ Skipping '{f['filename']}' — no download URL available.")
-
-    if not selected_valid:
-        print("❌ None of the selected files have valid download URLs.")
-        return
-
-    # 6. Parallel downloads
-    if len(selected_valid) > 1:
-        parallel_choice = input("Download files in parallel? (y/N): ").strip().lower()
-        if parallel_choice == "y":
-            while True:
-                try:
-                    num_workers = int(input(f"How many files to download at once? (1-{min(MAX_PARALLEL_DOWNLOADS,len(selected_valid))}): "))
-                    if 1 <= num_workers <= min(MAX_PARALLEL_DOWNLOADS, len(selected_valid)):
-                        break
-                except ValueError:
-                    continue
-
-            with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                futures = []
-                for pos, f in enumerate(selected_valid):
-                    futures.append(executor.submit(download_file, f["download"], f["filename"], pos))
-                for future in as_completed(futures):
-                    future.result()
-            return
-
-    # 7. Sequential download
-    for f in selected_valid:
-        download_file(f["download"], f["filename"])
-
-
-# ---------------------------
-# In Progress Function
-# ---------------------------
-def in_progress():
-    limit = prompt_limit("\nType how many torrents to check, or leave blank for all (default): ")
-    torrents = fetch_torrents(limit=limit, filter='inprogress')
-
-    if torrents:
-        in_progress_checker(torrents)
-    else:
-        if limit == 0:
-            print("\nNo Active Torrents\n")
-        else:
-            print(f"Checked {limit} torrents and found {len(torrents)} active")
-
-
-def in_progress_checker(torrents):
-    for t in torrents:
-        progress = t.get("progress", 0.0)
-        speed = t.get("speed", 0)
-        filename = t.get("filename", "Unnamed")
-        size = t.get("bytes", 0)
-        status = t.get("status", "unknown").lower()
-        print(
-            f"{progress:.2f}% @ {format_speed(speed)} - {filename} "
-            f"({format_size(size)}) - Status: {status}"
-        )
-
-# ---------------------------
-# .torrent Uploader
-# ---------------------------
-
-def upload_torrents():
-    torrents = list_torrent_files()
-    if not torrents:
-        print("No .torrent files found in current directory.")
-        return
-
-    print("\nSelect a .torrent file:\n")
-    for idx, f in enumerate(torrents, 1):
-        print(f"{idx}: {f}")
-    print("\n0: All files\n")
-
-    sel = input("Select torrents by number (comma separated, ranges allowed, or 0 for all): ").strip()
-    if sel == "0" or sel == "":
-        selected_indices = list(range(1, len(torrents) + 1))
-    else:
-        selected_indices = parse_selection(sel, len(torrents))
-
-    if not selected_indices:
-        print("⚠️ No torrents selected.")
-        return
-
-    os.makedirs(PROCESSED_DIR, exist_ok=True)
-
-    for idx in selected_indices:
-        selected_file = torrents[idx - 1]
-        print(f"\nProcessing {selected_file}")
-        if process_torrent_workflow(selected_file, TOKEN):
-            shutil.move(selected_file, os.path.join(PROCESSED_DIR, selected_file))
-
-def list_torrent_files():
-    return [f for f in os.listdir() if f.lower().endswith(".torrent")]
-
-def upload_torrent_file(torrent_path, token, host=None):
-    url = "https://api.real-debrid.com/rest/1.0/torrents/addTorrent"
-    if host:
-        url += f"?host={host}"
-    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/octet-stream"}
-    with open(torrent_path, "rb") as f:
-        data = f.read()
-    try:
-        resp = requests.put(url, headers=headers, data=data, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
-        if resp.status_code == 201:
-            tid = resp.json().get("id")
-            print(f"✅ Torrent uploaded successfully. ID: {tid}")
-            return tid
-        else:
-            print(f"❌ Unexpected response: {resp.status_code} {resp.text}")
-            return None
-    except requests.RequestException as e:
-        print(f"❌ Upload failed: {e}")
-        return None
-
-def get_torrent_info(torrent_id, token):
-    headers = {"Authorization": f"Bearer {token}"}
-    try:
-        resp = requests.get(f"https://api.real-debrid.com/rest/1.0/torrents/info/{torrent_id}",
-                            headers=headers, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
-        return resp.json()
-    except requests.RequestException as e:
-        print(f"⚠️ Error fetching torrent info: {e}")
-        return None
-
-def select_files(torrent_id, token, file_ids):
-    headers = {"Authorization": f"Bearer {token}"}
-    try:
-        resp = requests.post(
-            f"https://api.real-debrid.com/rest/1.0/torrents/selectFiles/{torrent_id}",
-            data={"files": file_ids},
-            headers=headers,
-            timeout=REQUEST_TIMEOUT
-        )
-        if resp.status_code in (202, 204):
-            print("✅ File selection sent successfully.")
-            return True
-        else:
-            print(f"❌ Failed to select files: {resp.status_code} {resp.text}")
-            return False
-    except requests.RequestException as e:
-        print(f"⚠️ Exception selecting files: {e}")
-        return False
-
-def wait_for_metadata(torrent_id, token, max_wait=15, interval=5):
-    waited = 0
-    while waited < max_wait:
-        info = get_torrent_info(torrent_id, token)
-        if not info:
-            break
-        status = info.get("status", "")
-        files = info.get("files", [])
-        print(f"⏳ Status: {status}")
-        if status in ("waiting_files_selection", "waiting_files") and files:
-            print(f"✅ Found {len(files)} files")
-            return files, status
-        elif status in ("downloading", "downloaded", "ready") and files:
-            print(f"✅ Torrent is already downloading or ready (status: {status})")
-            return files, status
-        time.sleep(interval)
-        waited += interval
-    print("⚠️ Timeout waiting for metadata or files.")
-    return None, None
-
-
-def prompt_user_to_select_files(files):
-    print("\nAvailable files in torrent:\n")
-    for idx, f in enumerate(files, 1):
-        name = f.get("path", f.get("filename", f.get("id")))
-        size = f.get("bytes", 0)
-        size_mb = round(size / (1024 * 1024), 2)
-        print(f"{idx}: {name} ({size_mb} MB)")
-
-    print("\n0: Select all files")
-
-    while True:
-        selection_input = input(
-            "\nEnter file numbers to select (e.g. 1,3-5) or leave blank to cancel and delete: "
-        ).strip()
-
-        if selection_input == "0":
-            return [f["id"] for f in files]
-
-        if selection_input == "":
-            return None
-
-        selected_indexes = parse_selection(selection_input, len(files))
-        if selected_indexes:
-            return [files[i - 1]["id"] for i in selected_indexes]
-
-        print("❌ Invalid selection. Try again.")
-
-
-
-def wait_for_download_start(torrent_id, token, max_attempts=12, interval=5):
-    attempts = 0
-    while attempts < max_attempts:
-        info = get_torrent_info(torrent_id, token)
-        if not info:
-            break
-        status = info.get("status", "")
-        if status in ("downloading", "downloaded", "ready"):
-            print(f"✅ Success: Torrent status is {status}")
-            return True
-        print(f"⏳ Waiting for download to start... (status: {status})")
-        time.sleep(interval)
-        attempts += 1
-    print("⚠️ Torrent did not start downloading in time.")
-    return False
-
-def process_torrent_workflow(torrent_path, token, host=None):
-    attempt = 1
-    tid = None  # Track TID so we can delete if no files selected
-    while attempt <= MAX_RETRIES + 1:
-        if attempt > 1:
-            print(f"\n🔁 Retrying upload (Attempt {attempt} of {MAX_RETRIES + 1})")
-
-        tid = upload_torrent_file(torrent_path, token, host)
-        if not tid:
-            attempt += 1
-            continue
-
-        files, status = wait_for_metadata(tid, token)
-        if not files:
-            delete_torrent(tid)
-            attempt += 1
-            continue
-
-        if len(files) == 1:
-            selected_ids = [files[0]["id"]]
-            filename = files[0].get("path", files[0].get("filename", "Unknown"))
-            print(f"✅ Automatically selecting single file: {filename}")
-        else:
-            selected_ids = prompt_user_to_select_files(files)
- 
-        # choosing to cancel
-        if selected_ids is None:
-            delete_torrent(tid)
-            return False
-
-        # Backup ceck if user selected no files
-        if not selected_ids:
-            delete_torrent(tid)
-            return False
-
-        file_ids = ",".join(map(str, selected_ids))
-        if not select_files(tid, token, file_ids):
-            delete_torrent(tid)
-            attempt += 1
-            continue
-
-        wait_for_download_start(tid, token)
-        return True
-
-    print("❌ Unable to process .torrent after multiple attempts. Please try manually.")
-    return False
-
-
-
-# ---------------------------
-# Duplicate Remover
-# ---------------------------
-
-def remove_duplicates():
-    # Prompt user for number of torrents with validation
-    while True:
-        choice = input("\nType how many torrents to check for duplicates, or leave blank for all (default): ").strip()
-        if choice == "":
-            limit = None  # all torrents
-            break
-        elif choice.isdigit() and int(choice) > 0:
-            limit = int(choice)
-            break
-        else:
-            print("❌ Invalid input. Please enter a positive number or leave blank for all.")
-
-    # Fetch torrents
-    torrents = fetch_torrents(limit=limit)
-
-    if not torrents:
-        print("No torrents fetched.")
-        return
-
-    print(f"\nChecked {len(torrents)} torrents for duplicates.\n")
-
-    # Sort by generation timestamp
-    torrents.sort(key=lambda t: t.get("generated", 0))
-
-    # Group by hash to find duplicates
-    hash_groups = {}
-    for t in torrents:
-        thash = t.get("hash")
-        if not thash:
-            continue
-        hash_groups.setdefault(thash, []).append(t)
-
-    duplicates = []
-
-    print("🔍 Checking for duplicate torrents...\n")
-    for thash, group in hash_groups.items():
-        if len(group) > 1:
-            print(f"Hash: {thash}")
-            for i, torrent in enumerate(group):
-                tid = torrent.get("id")
-                name = torrent.get("filename", "Unnamed")
-                if i == 0:
-                    print(f"  ✅  Kept:    {name} (ID: {tid})")
-                else:
-                    print(f"  🗑️  Duplicate: {name} (ID: {tid})")
-                    duplicates.append(tid)
-            print()
-
-    if not duplicates:
-        print("✅ No duplicates found.")
-        return
-
-    confirm = input("⚠️ Proceed with deleting these duplicates? (y/N): ").strip().lower()
-    if confirm in ("y", "yes"):
-        for tid in duplicates:
-            delete_torrent(tid)
-        print(f"✅ Deleted {len(duplicates)} duplicates.")
-    else:
-        print("❌ Deletion cancelled.")
-
-
-# ---------------------------
-# Main Run
-# ---------------------------
-def main_menu():
-       
-   # print("\nIf you liked this tool you can support via my referral code next time you renew your sub.\n")
-    
-    if CHECK_PREMIUM:
-        check_user_info()
-    
-    while True:
-        print("\n=== Real-Debrid Toolkit ===")
-
-        print("1. Upload .torrent files")
-        print("2. Check in-progress torrents")
-        print("3. Download torrent files")
-        print("4. Download hoster links")
-        print("5. Find & remove duplicate torrents")
-        print("6. Renew Subscription")
-
-
-        print("0. Exit\n")
-        choice = input("Select an option: ").strip()
-        if choice == "1":
-            upload_torrents()
-        elif choice == "2":
-            in_progress()
-        elif choice == "3":
-            torrent_downloader()
-        elif choice == "4":
-            hoster_downloader()
-        elif choice == "5":  
-            remove_duplicates()
-       # elif choice == "6":
-       #     referal()
-
-        elif choice == "0":
-            url = "http://real-debrid.com/?id=3488563"
-            print("If you liked this tool you can support via my referral code next time you renew your sub.")
-            
-            print(url)
-
-            open_choice = input("Open URL now? (y/N): ").strip().lower()
-            if open_choice == "y":
-                try:
-                    webbrowser.open(url)
-                    print("✅ URL opened in your default browser.")
-                except Exception as e:
-                    print(f"⚠️ Failed to open browser: {e}")
-            exit(0)
-        else:
-            print("Invalid selection. Try again.")
-
-def referal():
-    url = "http://real-debrid.com/?id=3488563"
-    try:
-        webbrowser.open(url)
-        print("✅ URL opened in your default browser.")
-    except Exception as e:
-        print(f"⚠️ Failed to open browser: {e}")
-    exit(0)
-
-if __name__ == "__main__":
-    try:
-        main_menu()
-    except KeyboardInterrupt:
-        print("\nAborted by user.")
-        exit(1)
+import argparse
+import io
+import os
+import re
+import sys
+import time
+import json
+import queue
+import random
+import atexit
+import shutil
+import functools
+import threading
+import requests
+import webbrowser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tqdm import tqdm
+
+try:
+    import orjson  # optional: ~3-6x faster JSON parsing on the fetch path
+except ImportError:
+    orjson = None
+
+def json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(data):
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+# ==================== #
+#     User Config      #
+# ==================== #
+
+API_BASE = "https://api.real-debrid.com/rest/1.0"
+REQUEST_TIMEOUT = 10 # timeout for all API calls
+MAX_RETRIES = 3 # retries for file processes
+PAGE_LIMIT = 250 # RD Torrents per 'page' - max 500 recommended by RD
+DOWNLOAD_DIR = "Downloaded Files"
+PROCESSED_DIR = "Processed Files"
+MAX_PARALLEL_DOWNLOADS = 4 # max 4 recommended by RD
+MAX_DELETE_WORKERS = 16 # parallel deletions for duplicate removal
+MAX_UPLOAD_WORKERS = 6 # parallel .torrent upload workflows
+MAX_FETCH_WORKERS = 8 # parallel page fetches when listing torrents
+API_RATE_LIMIT = 250 # RD cap of 250 requests per minute
+CHECK_PREMIUM = True # start with a account check
+TORRENTS_CACHE_FILE = ".torrents_cache.json" # full torrent list cache for dedupe re-runs
+INFO_CACHE_DIR = os.path.join(".cache", "torrent_info") # per-torrent info cache
+UNRESTRICT_CACHE_FILE = os.path.join(".cache", "unrestrict.json") # link -> unrestrict result
+UNRESTRICT_CACHE_TTL = 6 * 3600 # RD download URLs stay valid for hours
+
+# Set from the command line (see __main__): --yes / --dry-run
+ASSUME_YES = False
+DRY_RUN = False
+
+# === Load API Key === #
+@functools.lru_cache(maxsize=1)
+def load_config():
+    """Parse config.json once; later lookups reuse the cached dict."""
+    with open("config.json", "rb") as f:
+        return json_loads(f.read())
+
+try:
+    TOKEN = load_config()["REAL_DEBRID_API_TOKEN"]
+except (FileNotFoundError, KeyError, ValueError) as e:
+    print(f"❌ Failed to load config.json: {e}")
+    exit(1)
+
+# === Shared HTTP session === #
+# Keep-alive connection to api.real-debrid.com so repeated calls skip the
+# TCP+TLS handshake. Auth header is set once here instead of per call.
+AUTH_HEADERS = {"Authorization": f"Bearer {TOKEN}"}
+SESSION = requests.Session()
+SESSION.headers.update(AUTH_HEADERS)
+SESSION.headers["Accept-Encoding"] = "gzip, deflate"  # torrent listings compress ~10x
+# Retry transient failures (and 429 rate limits, honouring Retry-After) inside
+# the transport so API calls survive network hiccups without hand-rolled
+# sleep loops. Jitter desynchronizes retry storms across workers.
+_retry_opts = dict(
+    total=MAX_RETRIES,
+    backoff_factor=1.0,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET", "POST", "PUT", "DELETE"),
+    respect_retry_after_header=True,
+)
+try:
+    SESSION_RETRY = Retry(backoff_jitter=0.5, **_retry_opts)
+except TypeError:  # urllib3 < 2 has no backoff_jitter
+    SESSION_RETRY = Retry(**_retry_opts)
+SESSION.mount("https://", HTTPAdapter(max_retries=SESSION_RETRY,
+                                      pool_connections=1,
+                                      pool_maxsize=MAX_DELETE_WORKERS))
+atexit.register(SESSION.close)
+
+# Separate unauthenticated session for the actual file downloads — the
+# hoster URLs are not the API, so the bearer token must not be sent there.
+DL_SESSION = requests.Session()
+DL_SESSION.mount("https://", HTTPAdapter(pool_connections=MAX_PARALLEL_DOWNLOADS + 4,
+                                         pool_maxsize=MAX_PARALLEL_DOWNLOADS))
+atexit.register(DL_SESSION.close)
+
+# Endpoints hit inside retry/poll loops, assembled once instead of per call.
+ADD_TORRENT_URL = f"{API_BASE}/torrents/addTorrent"
+TORRENT_INFO_URL = f"{API_BASE}/torrents/info/"
+SELECT_FILES_URL = f"{API_BASE}/torrents/selectFiles/"
+DELETE_TORRENT_URL = f"{API_BASE}/torrents/delete/"
+
+# ---------------------------
+# Utilities
+# ---------------------------
+
+def rd_request(method, endpoint, **kwargs):
+    url = f"{API_BASE}/{endpoint.lstrip('/')}"
+    resp = SESSION.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+    resp.raise_for_status()
+    return json_loads(resp.content)
+
+def prompt_limit(prompt="Type how many torrents to check, or leave blank for all (default): "):
+    while True:
+        choice = input(prompt).strip()
+        if choice == "":
+            return None
+        if choice.isdigit() and int(choice) > 0:
+            return int(choice)
+        print("❌ Invalid input. Please enter a positive number or leave blank for all.")
+
+def check_user_info():
+    try:
+        resp = SESSION.get(f"{API_BASE}/user", timeout=REQUEST_TIMEOUT)
+        if resp.status_code == 200:
+            user = json_loads(resp.content)
+            status = "✅ Premium" if user.get("premium") else "❌ Non-premium"
+            expiration = user.get("expiration")
+            if expiration:
+                try:
+                    # fromisoformat is ~10x faster than strptime and, from
+                    # Python 3.11, also accepts the trailing Z directly
+                    exp_date = datetime.fromisoformat(expiration.replace("Z", "+00:00"))
+                    days_left = (exp_date - datetime.now(timezone.utc)).days
+                    print(f"{status} — expires in {days_left} day(s)")
+                except ValueError:
+                    print(f"{status} — expiration date format error: {expiration}")
+            else:
+                print(f"{status}")
+        else:
+            print("⚠️ Failed to retrieve user info.")
+    except requests.RequestException as e:
+        print(f"⚠️ Error getting user info: {e}")
+
+
+# ---------------------------
+# Shared Helpers
+# ---------------------------
+
+
+_SIZE_UNITS = ((30, "GB"), (20, "MB"), (10, "KB"))
+
+def format_size(num):
+    if num is None:
+        return "unknown size"
+    try:
+        b = int(num)
+    except Exception:
+        return "unknown size"
+    if b > 0:
+        # bit_length picks the unit without re-testing power-of-two bounds
+        bl = b.bit_length()
+        for shift, unit in _SIZE_UNITS:
+            if bl > shift:
+                return f"{b / (1 << shift):.2f} {unit}"
+    return f"{b} B"
+
+# multiply by a precomputed reciprocal instead of dividing per torrent row
+_MB = 1 / (1024 * 1024)
+
+def format_speed(bytes_per_sec):
+    if bytes_per_sec is None:
+        return "0.00MB/s"
+    return f"{bytes_per_sec * _MB:.2f}MB/s"
+
+def resolve_filename_collision(directory, filename, existing=None):
+    # One scandir instead of a stat() per candidate; callers handling a
+    # batch can pass a shared `existing` set to probe purely in memory.
+    if existing is None:
+        try:
+            with os.scandir(directory) as it:
+                existing = {e.name for e in it}
+        except FileNotFoundError:
+            existing = set()
+    base, ext = os.path.splitext(filename)
+    candidate = filename
+    i = 1
+    while candidate in existing:
+        candidate = f"{base} ({i}){ext}"
+        i += 1
+    existing.add(candidate)
+    return candidate
+
+def open_url(url):
+    try:
+        webbrowser.open(url)
+        print("✅ URL opened in your default browser.")
+    except Exception as e:
+        print(f"⚠️ Failed to open browser: {e}")
+
+# "7" or "3-12", with optional whitespace around the dash
+_SELECTION_RE = re.compile(r"(\d+)\s*(?:-\s*(\d+))?$")
+
+def parse_selection(selection_input, max_index):
+    selection = set()
+    invalid_parts = []
+
+    for part in selection_input.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        m = _SELECTION_RE.match(part)
+        if m:
+            start = int(m.group(1))
+            end = int(m.group(2)) if m.group(2) else start
+            if 1 <= start <= end <= max_index:
+                selection.update(range(start, end + 1))
+                continue
+        invalid_parts.append(part)
+
+    if invalid_parts:
+        print(f"⚠️ Ignored invalid parts: {', '.join(invalid_parts)}")
+
+    return sorted(selection)
+
+def delete_torrent(tid, verbose=True):
+    try:
+        resp = SESSION.delete(DELETE_TORRENT_URL + tid,
+                              timeout=REQUEST_TIMEOUT)
+        if resp.status_code == 204:
+            _torrent_info_cache.pop(tid, None)
+            _torrents_list_cache.clear()
+            if verbose:
+                print(f"🗑️ Deleted torrent ID: {tid}")
+            return True
+        if verbose:
+            print(f"⚠️ Failed to delete torrent ID {tid}: Status {resp.status_code}")
+    except requests.RequestException as e:
+        if verbose:
+            print(f"⚠️ Exception deleting torrent ID {tid}: {e}")
+    return False
+
+def delete_torrents(tids):
+    """
+    Delete a batch of torrents through the shared Session.
+
+    RD has no bulk-delete endpoint yet, so this fans the IDs out over the
+    keep-alive connection pool; if the API grows one, only this function
+    needs to change. Returns the number of successful deletions.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=MAX_DELETE_WORKERS) as pool:
+        futures = {}
+        for tid in tids:
+            time.sleep(60 / API_RATE_LIMIT)  # stay under RD's request cap
+            futures[pool.submit(delete_torrent, tid, verbose=False)] = tid
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    # one summary write instead of a print per deletion
+    buf = io.StringIO()
+    for tid, ok in results.items():
+        buf.write(f"🗑️ Deleted torrent ID: {tid}\n" if ok
+                  else f"⚠️ Failed to delete torrent ID: {tid}\n")
+    sys.stdout.write(buf.getvalue())
+    return sum(results.values())
+
+def fetch_torrents_page(page, page_size=PAGE_LIMIT):
+    resp = SESSION.get(
+        f"{API_BASE}/torrents",
+        params={"page": page, "limit": page_size},
+        timeout=REQUEST_TIMEOUT
+    )
+    resp.raise_for_status()
+    return resp
+
+def load_torrents_cache(total_count):
+    """Return the cached torrent list if the account still has the same total."""
+    try:
+        with open(TORRENTS_CACHE_FILE, "rb") as f:
+            cache = json_loads(f.read())
+        if cache.get("total_count") == total_count:
+            return cache.get("torrents")
+    except (FileNotFoundError, ValueError, AttributeError):
+        pass
+    return None
+
+def save_torrents_cache(total_count, torrents):
+    try:
+        with open(TORRENTS_CACHE_FILE, "wb") as f:
+            f.write(json_dumps({"total_count": total_count, "torrents": torrents}))
+    except OSError as e:
+        print(f"⚠️ Failed to write torrent cache: {e}")
+
+def parse_torrents_page(resp):
+    # Most of the bytes per torrent are in the links/files listings, which
+    # nothing in the list views or dedupe uses (per-torrent detail goes
+    # through torrents/info instead). Drop them right after parsing so we
+    # only keep the slim dicts around.
+    torrents = json_loads(resp.content)
+    for t in torrents:
+        t.pop("links", None)
+        t.pop("files", None)
+    return torrents
+
+def iter_torrent_pages(limit=None, use_cache=False, failures=None):
+    """
+    Yield (page, torrents) tuples as pages arrive.
+
+    Pages after the first are fetched concurrently and yielded in completion
+    order, so callers can start processing while later pages are still in
+    flight; callers that need the API's ordering reassemble by page number.
+    Pass a list as `failures` to learn which pages (if any) errored out.
+    """
+    # A small limit doesn't need full pages — ask the API for exactly that
+    # many per page so we don't pull (and parse) records we'll throw away.
+    # The size must stay uniform across pages since RD offsets by page*limit.
+    page_size = min(PAGE_LIMIT, limit) if limit is not None else PAGE_LIMIT
+
+    # Page 1 tells us the total via X-Total-Count; the rest can be fetched
+    # concurrently instead of walking pages one round-trip at a time.
+    try:
+        resp = fetch_torrents_page(1, page_size)
+        first_page = parse_torrents_page(resp)
+        total_count = int(resp.headers.get("X-Total-Count", "0"))
+    except requests.RequestException as e:
+        print(f"⚠️ Error fetching torrents page 1: {e}")
+        if failures is not None:
+            failures.append(1)
+        return
+
+    # Re-runs (e.g. dedupe after a cancelled confirm) can reuse the cached
+    # full list as long as the account's total count is unchanged. Only
+    # callers that read immutable fields should opt in.
+    if use_cache and limit is None:
+        cached = load_torrents_cache(total_count)
+        if cached is not None:
+            print(f"📄 Loaded {len(cached)} torrents from local cache.")
+            yield 1, cached
+            return
+
+    yield 1, first_page
+
+    total_pages = (total_count + page_size - 1) // page_size if total_count else 0
+    if limit is not None:
+        total_pages = min(total_pages, (limit + page_size - 1) // page_size)
+
+    if total_pages <= 1:
+        return
+
+    complete = True
+    pages = {1: first_page} if use_cache and limit is None else None
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, total_pages - 1)) as pool:
+        futures = {pool.submit(fetch_torrents_page, p, page_size): p
+                   for p in range(2, total_pages + 1)}
+        for future in as_completed(futures):
+            page = futures[future]
+            try:
+                torrents = parse_torrents_page(future.result())
+            except requests.RequestException as e:
+                print(f"⚠️ Error fetching torrents page {page}: {e}")
+                complete = False
+                if failures is not None:
+                    failures.append(page)
+                continue
+            print(f"📄 Found {len(torrents)} torrents on page {page}")
+            if pages is not None:
+                pages[page] = torrents
+            yield page, torrents
+
+    if pages is not None and complete:
+        flat = []
+        for page in sorted(pages):
+            flat.extend(pages[page])
+        save_torrents_cache(total_count, flat)
+
+# Consecutive menu actions (status check, then dedupe) each pull the torrent
+# list; within a few seconds the account can't have changed except through us,
+# and the mutating helpers clear this memo, so repeats are served from memory.
+TORRENTS_LIST_TTL = 10
+_torrents_list_cache = {}  # limit -> (fetched_at, torrents)
+
+def fetch_torrents(limit=None, filter=None, use_cache=False):
+    hit = _torrents_list_cache.get(limit)
+    if hit and time.monotonic() - hit[0] < TORRENTS_LIST_TTL:
+        all_torrents = hit[1]
+    else:
+        print(f"🔄 Retrieving {'last ' + str(limit) if limit else 'all'} torrents...\n")
+
+        pages = {}
+        failures = []
+        for page, torrents in iter_torrent_pages(limit=limit, use_cache=use_cache,
+                                                 failures=failures):
+            pages[page] = torrents
+
+        all_torrents = []
+        for page in sorted(pages):
+            all_torrents.extend(pages[page])
+
+        # trim to the user-defined limit
+        if limit is not None:
+            all_torrents = all_torrents[:limit]
+
+        # Only memoize clean fetches — caching a partial (or empty, when
+        # page 1 errored) list would mask the failure from retries for the
+        # whole TTL.
+        if not failures:
+            _torrents_list_cache[limit] = (time.monotonic(), all_torrents)
+
+    if filter == 'inprogress':
+        filtered = [t for t in all_torrents if t.get("status") != "downloaded"]
+        print(f"✅ Checked {len(all_torrents)} torrents — found {len(filtered)} in-progress.\n")
+        return filtered
+
+    print(f"✅ Found {len(all_torrents)} torrents in total.\n")
+    return all_torrents
+
+
+def download_files_parallel(files, num_workers):
+    # One directory scan for the whole batch; the workers share (and extend)
+    # the same name set instead of re-scanning per file.
+    os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+    with os.scandir(DOWNLOAD_DIR) as it:
+        existing = {e.name for e in it}
+
+    # Hand each worker a tqdm row from a fixed slot pool so the visible
+    # bar count stays bounded at num_workers; without this, file #5 would
+    # claim row 5 while rows 0-3 are still redrawing, wasting terminal
+    # space and tqdm refresh time proportional to the batch size.
+    slots = queue.Queue()
+    for i in range(num_workers):
+        slots.put(i)
+
+    def task(f):
+        pos = slots.get()
+        try:
+            return download_file(f["download"], f["filename"], pos, existing=existing)
+        finally:
+            slots.put(pos)
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(task, f) for f in files]
+        for future in as_completed(futures):
+            future.result()
+
+# ---------------------------
+# Downloader Function
+# ---------------------------
+def torrent_downloader():
+    # 1 How many torrents to fetch
+    while True:
+        choice = input("Type how many torrents to check, or leave blank for default (100): ").strip().lower()
+        if choice == "":
+            limit = 100  # last 100 default
+            break
+        elif choice.isdigit() and int(choice) > 0:
+            limit = int(choice)
+            break
+        else:
+            print("❌ Invalid input. Please enter a positive number or leave blank for all.")
+
+    # 2 Skip non-downloaded?
+    
+    while True:
+        choice = input("Skip non-downloaded torrents? [Y/n] (default Y): ").strip().lower()
+
+        if choice in ("", "y", "yes"):
+            skip_non_downloaded = True
+            print("Skipping non-completed torrents")
+            break
+        elif choice in ("n", "no"):
+            skip_non_downloaded = False
+            print("Non-completed torrents will be shown with status, download links can't be generated for these files")
+            break
+        else:
+            print("❌ Invalid input. Please select Y, y, N, or n.")
+
+
+    # 3 Fetch torrents
+    torrents = fetch_torrents(limit=limit)
+    if not torrents:
+        print("No torrents found in your Real-Debrid account.")
+        return
+
+    # 4 Filter out non completed torrents
+    if skip_non_downloaded:
+        torrents = [t for t in torrents if t.get("status") == "downloaded"]
+
+    if not torrents:
+        print("No eligible torrents found.")
+        return
+
+    # 5 Show avaliable torrents
+    print("\nAvailable torrents:\n")
+    for idx, t in enumerate(torrents, 1):
+        size_str = format_size(t.get("bytes"))
+        status = t.get("status", "").lower()
+        if status == "downloaded":
+            print(f"{idx}: {t.get('filename')} ({size_str})")
+        else:
+            print(f"{idx}: {t.get('filename')} ({size_str}) - Status: {status}")
+
+    # 6 Select torrents (supports ranges and multiple selections)
+    sel = input("\nSelect torrents by number (comma separated, ranges allowed, or 0 for all): ").strip()
+    if sel == "0" or sel == "":
+        selected = torrents
+    else:
+        indices = parse_selection(sel, len(torrents))
+        selected = [torrents[i - 1] for i in indices]
+
+    if not selected:
+        print("⚠️ No torrents selected.")
+        return
+
+    # 7 Generate download links (torrents run concurrently so one torrent's
+    # info fetch overlaps another's link unrestricts; output keeps selection order)
+    all_files = []
+    file_map = []  # keep track of files with numbering
+    print("\nGenerating download links...")
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as pool:
+        for t, files in zip(selected, pool.map(lambda t: unrestrict_torrent_links(t["id"]), selected)):
+            if not files:
+                print(f"⚠️ No files found or failed to generate links for {t['filename']}.")
+                continue
+            print(f"\n{t['filename']}:")
+            for f in files:
+                file_map.append(f)
+                print(f"{len(file_map)} - {f['filename']} ({format_size(f['filesize'])})")
+            all_files.extend(files)
+
+    if not all_files:
+        print("⚠️ No unrestricted links could be generated.")
+        return
+
+    # 8 File selection (auto-select if only one file)
+    if len(file_map) == 1:
+        selected_files = file_map
+        f = file_map[0]
+        print(f"\n✅ Auto selected single file torrent: {f['filename']} ({format_size(f['filesize'])})")
+    else:
+        sel_files = input(
+            "\nSelect files to download (comma separated, ranges allowed, or 0 for all): "
+        ).strip()
+
+        if sel_files == "0" or sel_files == "":
+            selected_files = file_map
+        else:
+            indices = parse_selection(sel_files, len(file_map))
+            selected_files = [file_map[i - 1] for i in indices]
+
+        if not selected_files:
+            print("⚠️ No files selected.")
+            return
+
+
+    # 9 Parallel download prompt
+    if len(selected_files) > 1:
+        parallel_choice = input("Download files in parallel? (y/N): ").strip().lower()
+        if parallel_choice == "y":
+            while True:
+                try:
+                    num_workers = int(input(f"How many files to download at once? (1-{min(MAX_PARALLEL_DOWNLOADS,len(selected_files))}): "))
+                    if 1 <= num_workers <= min(MAX_PARALLEL_DOWNLOADS,len(selected_files)):
+                        break
+                except ValueError:
+                    continue
+
+            download_files_parallel(selected_files, num_workers)
+            return
+
+    # 10 Run downloads
+    for f in selected_files:
+        download_file(f["download"], f["filename"])
+
+# In-memory view of the on-disk unrestrict memo; loaded lazily, written
+# back once at exit. Guarded by a lock since unrestrict workers run in
+# parallel threads.
+_unrestrict_cache = None
+_unrestrict_lock = threading.Lock()
+
+def _save_unrestrict_cache():
+    try:
+        os.makedirs(os.path.dirname(UNRESTRICT_CACHE_FILE), exist_ok=True)
+        tmp = f"{UNRESTRICT_CACHE_FILE}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(json_dumps(_unrestrict_cache))
+        os.replace(tmp, UNRESTRICT_CACHE_FILE)
+    except OSError as e:
+        print(f"⚠️ Failed to write unrestrict cache: {e}")
+
+def cached_unrestrict(link):
+    """
+    POST unrestrict/link with an on-disk memo keyed by the raw link.
+    RD download URLs stay valid for hours, so re-runs (and repeated links
+    in one run) skip the POST until the entry expires.
+    """
+    global _unrestrict_cache
+    now = time.time()
+    with _unrestrict_lock:
+        if _unrestrict_cache is None:
+            try:
+                with open(UNRESTRICT_CACHE_FILE, "rb") as f:
+                    _unrestrict_cache = json_loads(f.read())
+            except (FileNotFoundError, ValueError):
+                _unrestrict_cache = {}
+            atexit.register(_save_unrestrict_cache)
+        entry = _unrestrict_cache.get(link)
+        if entry and entry.get("expires_at", 0) > now:
+            return entry["result"]
+
+    result = rd_request("POST", "unrestrict/link", data={"link": link})
+
+    with _unrestrict_lock:
+        _unrestrict_cache[link] = {
+            "result": result,
+            "expires_at": now + UNRESTRICT_CACHE_TTL,
+        }
+    return result
+
+def load_cached_torrent_info(torrent_id):
+    try:
+        with open(os.path.join(INFO_CACHE_DIR, f"{torrent_id}.json"), "rb") as f:
+            return json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return None
+
+def save_cached_torrent_info(torrent_id, info):
+    # written via a temp file + os.replace so readers never see half a file
+    try:
+        os.makedirs(INFO_CACHE_DIR, exist_ok=True)
+        path = os.path.join(INFO_CACHE_DIR, f"{torrent_id}.json")
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(json_dumps(info))
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"⚠️ Failed to cache torrent info: {e}")
+
+def unrestrict_torrent_links(torrent_id):
+    """
+    Process to generate download links; transport retries happen in the
+    Session adapter, so only final failures surface here.
+    """
+    # A downloaded torrent's links never change, so its info can be reused
+    # across runs instead of re-fetched from RD every time.
+    info = load_cached_torrent_info(torrent_id)
+    if info is None:
+        try:
+            info = rd_request("GET", f"torrents/info/{torrent_id}")
+        except requests.RequestException as e:
+            print(f"⚠️ Failed to fetch torrent info for ID {torrent_id}: {e}")
+            return []
+        if info.get("status") == "downloaded":
+            save_cached_torrent_info(torrent_id, info)
+
+    if "links" not in info or not info["links"]:
+        return []
+
+    # Unrestrict links concurrently over the pooled Session; results keep
+    # the original link order via their index.
+    results = [None] * len(info["links"])
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as pool:
+        futures = {
+            pool.submit(cached_unrestrict, raw_link): i
+            for i, raw_link in enumerate(info["links"])
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except requests.RequestException as e:
+                print(f"❌ Skipping link, failed to unrestrict: {e}")
+                continue
+            results[futures[future]] = {
+                "filename": result.get("filename"),
+                "download": result.get("download"),
+                "filesize": result.get("filesize"),
+            }
+    return [r for r in results if r]
+
+# guards the shared name set when a download batch resolves collisions
+_existing_names_lock = threading.Lock()
+
+def download_file(url, filename, position=0, existing=None):
+    os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+    if existing is not None:
+        with _existing_names_lock:
+            filename = resolve_filename_collision(DOWNLOAD_DIR, filename, existing)
+    else:
+        filename = resolve_filename_collision(DOWNLOAD_DIR, filename)
+    filepath = os.path.join(DOWNLOAD_DIR, filename)
+
+    pbar = None
+    downloaded = 0  # bytes already on disk; retries resume from here
+
+    try:
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                # RD hosts support Range, so a failed attempt picks up where
+                # the last one stopped instead of re-downloading from byte 0
+                headers = {"Range": f"bytes={downloaded}-"} if downloaded else {}
+                with DL_SESSION.get(url, stream=True, timeout=REQUEST_TIMEOUT,
+                                    headers=headers) as resp:
+                    resp.raise_for_status()
+                    if downloaded and resp.status_code != 206:
+                        downloaded = 0  # server ignored the Range; start over
+                    total_size = int(resp.headers.get("Content-Length", 0)) + downloaded
+                    chunk_size = 1 << 20  # 1 MiB: ~128x fewer Python-level iterations than 8 KiB
+
+                    # Create tqdm ONCE
+                    if pbar is None:
+                        pbar = tqdm(
+                            total=total_size,
+                            unit="B",
+                            unit_scale=True,
+                            desc=filename,
+                            position=position,
+                            leave=False,
+                            dynamic_ncols=True,
+                            bar_format="{percentage:3.0f}% {n_fmt}/{total_fmt} @ {rate_fmt}"
+                        )
+                    else:
+                        pbar.reset(total=total_size)
+                        if downloaded:
+                            pbar.update(downloaded)
+
+                    with open(filepath, "r+b" if downloaded else "wb") as f:
+                        if downloaded:
+                            f.seek(downloaded)
+                        elif total_size:
+                            # pre-size the file so the filesystem allocates
+                            # extents once instead of growing per write
+                            try:
+                                if hasattr(os, "posix_fallocate"):
+                                    os.posix_fallocate(f.fileno(), 0, total_size)
+                                else:
+                                    f.truncate(total_size)
+                            except OSError:
+                                pass
+                        if hasattr(os, "posix_fadvise"):
+                            try:
+                                os.posix_fadvise(f.fileno(), 0, total_size,
+                                                 os.POSIX_FADV_SEQUENTIAL)
+                            except OSError:
+                                pass
+                        # iter_content never yields empty chunks on a
+                        # streamed response, so no per-chunk guard needed.
+                        # Progress is flushed ~4x/sec rather than per chunk;
+                        # each update takes tqdm's lock and reformats the bar.
+                        acc = 0
+                        last = time.monotonic()
+                        for chunk in resp.iter_content(chunk_size=chunk_size):
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            acc += len(chunk)
+                            now = time.monotonic()
+                            if now - last >= 0.25:
+                                pbar.update(acc)
+                                acc = 0
+                                last = now
+                        if acc:
+                            pbar.update(acc)
+                        f.truncate()  # drop any pre-sized tail past the last byte
+
+                tqdm.write(f"✅ Downloaded: {filename}")
+                return True
+
+            except requests.RequestException as e:
+                tqdm.write(f"⚠️ Download attempt {attempt} failed for '{filename}': {e}")
+                time.sleep(2)
+
+        tqdm.write(f"❌ Failed to download: {filename}")
+        return False
+
+    except KeyboardInterrupt:
+        tqdm.write("⚠️ Download interrupted by user.")
+        return False
+
+    finally:
+        if pbar:
+            pbar.close()
+
+
+
+# ---------------------------
+# Hosted Links Converter
+# ---------------------------
+
+def link_host_online(link, ok_hosts):
+    host = urlparse(link).netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    # fuzzy match: the status keys are bare domains like "mega.nz"
+    return any(host == h or host.endswith(f".{h}") for h in ok_hosts)
+
+def unrestrict_folder_entries(result, out, label="Folder file"):
+    """
+    Normalize unrestrict/folder results (dicts or raw link strings) into
+    file dicts, unrestricting entries that lack a direct download URL.
+    """
+    files = []
+    for file_info in result:
+        if isinstance(file_info, dict):
+            filename = file_info.get("filename", "Unknown")
+            download = file_info.get("download")
+            filesize = file_info.get("filesize")
+            # Try to unrestrict if download is missing
+            if not download and "link" in file_info:
+                try:
+                    dl = cached_unrestrict(file_info["link"])
+                    download = dl.get("download")
+                    filesize = dl.get("filesize", filesize)
+                    filename = dl.get("filename", filename)
+                except requests.RequestException:
+                    out.append(f"⚠️ Failed to unrestrict individual file: {filename}")
+        elif isinstance(file_info, str):
+            # Bare link string — unrestrict it directly
+            filename = file_info
+            download = None
+            filesize = None
+            try:
+                dl = cached_unrestrict(file_info)
+                filename = dl.get("filename", filename)
+                download = dl.get("download")
+                filesize = dl.get("filesize", filesize)
+            except requests.RequestException:
+                out.append(f"⚠️ Failed to unrestrict file: {filename}")
+        else:
+            continue
+
+        files.append({
+            "filename": filename,
+            "download": download,
+            "filesize": filesize,
+        })
+        size_str = f" ({format_size(filesize)})" if filesize else ""
+        out.append(f"✅ {label}: {filename}{size_str}")
+
+    return files
+
+def process_hoster_link(link):
+    """
+    Unrestrict one hosted link (folder or single file).
+
+    Tries the likelier endpoint first ("folder" in the URL hints at a
+    folder link, e.g. mega) and falls back to the other exactly once.
+    Returns (files, output_lines); printing is left to the caller so
+    parallel workers don't interleave their output.
+    """
+    files = []
+    out = [f"\n🔄 Processing {link}\n"]
+    try:
+        methods = ("folder", "file") if "folder" in link.lower() else ("file", "folder")
+        for fallback, method in enumerate(methods):
+            label = "Folder file (fallback)" if fallback else "Folder file"
+            if method == "file":
+                try:
+                    result = cached_unrestrict(link)
+                except requests.RequestException:
+                    continue  # fall back to the folder endpoint
+                filename = result.get("filename", link)
+                filesize = result.get("filesize")
+                files.append({
+                    "filename": filename,
+                    "download": result.get("download"),
+                    "filesize": filesize,
+                })
+                size_str = f" ({format_size(filesize)})" if filesize else ""
+                out.append(f"✅ Processed: {filename}{size_str}")
+                break
+            else:
+                try:
+                    result = rd_request("POST", "unrestrict/folder", data={"link": link})
+                except requests.RequestException:
+                    continue  # fall back to the single-file endpoint
+                if result:
+                    files.extend(unrestrict_folder_entries(result, out, label))
+                else:
+                    out.append(f"⚠️ No files found in folder: {link}")
+                break
+        else:
+            out.append(f"❌ Could not process link at all: {link}")
+
+    except Exception as e:
+        out.append(f"⚠️ Unexpected error processing {link}: {e}")
+
+    return files, out
+
+def hoster_downloader():
+#Handles direct hosted links added to links.txt, basic catching for single file or folders
+
+    # 1. Host status — fetched once up front so dead-host links can be
+    # skipped before they burn a full timeout x retries each
+    ok_hosts = None
+    try:
+        status = rd_request("GET", "hosts/status")
+        ok_hosts = {h.lower() for h, info in status.items()
+                    if info.get("supported") and info.get("status") == "up"}
+    except requests.RequestException as e:
+        print(f"⚠️ Failed to fetch host status: {e}")
+        status = None
+
+    check_status = input("Show host status? [y/N] (default N): ").strip().lower()
+    if check_status in ("y", "yes") and status:
+        only_online = input("Only show online hosts? [Y/n] (default Y): ").strip().lower()
+        show_only_online = only_online in ("", "y", "yes")
+
+        print("\n=== Host Status ===")
+        for host, info in status.items():
+            is_online = host.lower() in ok_hosts
+
+            if show_only_online and not is_online:
+                continue  # skip offline hosts
+
+            line = f"{host:20} - "
+            if is_online:
+                line += "✅ Online"
+            else:
+                line += "❌ Offline/Unsupported"
+            print(line)
+        print()
+
+    # 2. Load links.txt file (case-insensitive)
+    links_file = None
+    with os.scandir() as it:
+        for e in it:
+            if e.is_file() and e.name.lower() == "links.txt":
+                links_file = e.name
+                break
+
+    if not links_file:
+        print("❌ No 'links.txt' file found in current directory.")
+        return
+
+    with open(links_file, "r", encoding="utf-8") as f:
+        raw_links = [line.strip() for line in f if line.strip()]
+
+    if not raw_links:
+        print("❌ 'links.txt' file is empty.")
+        return
+
+    print(f"\n📄 Found {len(raw_links)} links in '{links_file}'.\n")
+
+    # 2a. Drop links whose host RD reports as down/unsupported
+    if ok_hosts:
+        kept = []
+        for link in raw_links:
+            if link_host_online(link, ok_hosts):
+                kept.append(link)
+            else:
+                print(f"⚠️ Skipping '{link}' — host is offline or unsupported.")
+        raw_links = kept
+        if not raw_links:
+            print("❌ No links left after filtering offline hosts.")
+            return
+
+    # 3. Unrestrict each link (independent links run concurrently; each
+    # worker buffers its own output so lines don't interleave)
+    unrestricted = []
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as pool:
+        for files, out in pool.map(process_hoster_link, raw_links):
+            unrestricted.extend(files)
+            sys.stdout.write("\n".join(out) + "\n")
+
+    if not unrestricted:
+        print("❌ No valid unrestricted links were generated.")
+        return
+
+    # 4. Let user pick files to download
+    print("\nAvailable files:\n")
+    for idx, f in enumerate(unrestricted, 1):
+        size_str = f" ({format_size(f['filesize'])})" if f['filesize'] else ""
+        print(f"{idx}: {f['filename']}{size_str}")
+    print("\n0: Download all files")
+
+    sel = input("\nSelect files by number (comma separated, ranges allowed, or 0 for all): ").strip()
+    if sel in ("", "0"):
+        selected = unrestricted
+    else:
+        indices = parse_selection(sel, len(unrestricted))
+        selected = [unrestricted[i - 1] for i in indices]
+
+    if not selected:
+        print("⚠️ No files selected.")
+        return
+
+    # 5. Filter out files with no download URL
+    selected_valid = []
+    for f in selected:
+        if f.get("download"):
+            selected_valid.append(f)
+        else:
+            print(f"⚠️ Skipping '{f['filename']}' — no download URL available.")
+
+    if not selected_valid:
+        print("❌ None of the selected files have valid download URLs.")
+        return
+
+    # 6. Parallel downloads
+    if len(selected_valid) > 1:
+        parallel_choice = input("Download files in parallel? (y/N): ").strip().lower()
+        if parallel_choice == "y":
+            while True:
+                try:
+                    num_workers = int(input(f"How many files to download at once? (1-{min(MAX_PARALLEL_DOWNLOADS,len(selected_valid))}): "))
+                    if 1 <= num_workers <= min(MAX_PARALLEL_DOWNLOADS, len(selected_valid)):
+                        break
+                except ValueError:
+                    continue
+
+            download_files_parallel(selected_valid, num_workers)
+            return
+
+    # 7. Sequential download
+    for f in selected_valid:
+        download_file(f["download"], f["filename"])
+
+
+# ---------------------------
+# In Progress Function
+# ---------------------------
+def in_progress():
+    limit = prompt_limit("\nType how many torrents to check, or leave blank for all (default): ")
+    torrents = fetch_torrents(limit=limit, filter='inprogress')
+
+    if torrents:
+        in_progress_checker(torrents)
+    else:
+        if limit == 0:
+            print("\nNo Active Torrents\n")
+        else:
+            print(f"Checked {limit} torrents and found {len(torrents)} active")
+
+
+def in_progress_checker(torrents):
+    # Build the whole status screen and emit it in one write instead of one
+    # flushed print per torrent row.
+    sys.stdout.write("".join(
+        f"{t.get('progress', 0.0):.2f}% @ {format_speed(t.get('speed', 0))} "
+        f"- {t.get('filename', 'Unnamed')} ({format_size(t.get('bytes', 0))}) "
+        f"- Status: {t.get('status', 'unknown').lower()}\n"
+        for t in torrents
+    ))
+
+# ---------------------------
+# .torrent Uploader
+# ---------------------------
+
+def upload_torrents():
+    torrents = list_torrent_files()
+    if not torrents:
+        print("No .torrent files found in current directory.")
+        return
+
+    print("\nSelect a .torrent file:\n")
+    for idx, f in enumerate(torrents, 1):
+        print(f"{idx}: {f}")
+    print("\n0: All files\n")
+
+    sel = input("Select torrents by number (comma separated, ranges allowed, or 0 for all): ").strip()
+    if sel == "0" or sel == "":
+        selected_indices = list(range(1, len(torrents) + 1))
+    else:
+        selected_indices = parse_selection(sel, len(torrents))
+
+    if not selected_indices:
+        print("⚠️ No torrents selected.")
+        return
+
+    os.makedirs(PROCESSED_DIR, exist_ok=True)
+
+    selected = [torrents[idx - 1] for idx in selected_indices]
+
+    def run(path):
+        print(f"\nProcessing {path}")
+        return path, process_torrent_workflow(path)
+
+    # Each workflow spends most of its time waiting on RD status polls, so
+    # overlapping them collapses the wall time for multi-file batches. The
+    # prompt lock inside the workflow keeps file-selection questions serial.
+    if len(selected) == 1:
+        results = [run(selected[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(selected))) as pool:
+            results = list(pool.map(run, selected))
+
+    for path, ok in results:
+        if ok:
+            shutil.move(path, os.path.join(PROCESSED_DIR, path))
+
+def list_torrent_files():
+    with os.scandir() as it:
+        return [e.name for e in it if e.is_file() and e.name.lower().endswith(".torrent")]
+
+def upload_torrent_file(torrent_path, host=None):
+    url = ADD_TORRENT_URL if not host else f"{ADD_TORRENT_URL}?host={host}"
+    # Hand the file object to the session so urllib3 streams it in chunks
+    # instead of buffering the whole .torrent in memory; an explicit
+    # Content-Length avoids chunked transfer encoding.
+    headers = {
+        "Content-Type": "application/octet-stream",
+        "Content-Length": str(os.path.getsize(torrent_path)),
+    }
+    try:
+        with open(torrent_path, "rb") as f:
+            resp = SESSION.put(url, headers=headers, data=f, timeout=REQUEST_TIMEOUT)
+        resp.raise_for_status()
+        if resp.status_code == 201:
+            tid = json_loads(resp.content).get("id")
+            _torrents_list_cache.clear()
+            print(f"✅ Torrent uploaded successfully. ID: {tid}")
+            return tid
+        else:
+            print(f"❌ Unexpected response: {resp.status_code} {resp.text}")
+            return None
+    except requests.RequestException as e:
+        print(f"❌ Upload failed: {e}")
+        return None
+
+# Short-lived memo for torrent info: the upload workflow probes the same id
+# from several places within a few seconds (metadata wait, then download-start
+# wait), and a hit saves a full round-trip. Entries are dropped on
+# select_files/delete so state changes we caused are seen immediately.
+TORRENT_INFO_TTL = 3
+_torrent_info_cache = {}
+
+def get_torrent_info(torrent_id, fresh=False):
+    # The wait_for_* pollers pass fresh=True: their backoff starts below the
+    # TTL, and serving them from the memo would blind them to state changes.
+    if not fresh:
+        hit = _torrent_info_cache.get(torrent_id)
+        if hit and time.monotonic() - hit[0] < TORRENT_INFO_TTL:
+            return hit[1]
+    try:
+        resp = SESSION.get(TORRENT_INFO_URL + torrent_id,
+                           timeout=REQUEST_TIMEOUT)
+        resp.raise_for_status()
+        info = json_loads(resp.content)
+        _torrent_info_cache[torrent_id] = (time.monotonic(), info)
+        return info
+    except requests.RequestException as e:
+        print(f"⚠️ Error fetching torrent info: {e}")
+        return None
+
+def select_files(torrent_id, file_ids):
+    try:
+        resp = SESSION.post(
+            SELECT_FILES_URL + torrent_id,
+            data={"files": file_ids},
+            timeout=REQUEST_TIMEOUT
+        )
+        if resp.status_code in (202, 204):
+            _torrent_info_cache.pop(torrent_id, None)
+            _torrents_list_cache.clear()
+            print("✅ File selection sent successfully.")
+            return True
+        else:
+            print(f"❌ Failed to select files: {resp.status_code} {resp.text}")
+            return False
+    except requests.RequestException as e:
+        print(f"⚠️ Exception selecting files: {e}")
+        return False
+
+def wait_for_metadata(torrent_id, max_wait=15):
+    # Poll with exponential backoff: cached torrents usually report files
+    # within the first probe or two, so start at 0.5s instead of a fixed
+    # 5s cadence and double (with a little jitter) up to 10s for slow ones.
+    interval = 0.5
+    deadline = time.monotonic() + max_wait
+    while True:
+        info = get_torrent_info(torrent_id, fresh=True)
+        if info:
+            status = info.get("status", "")
+            files = info.get("files", [])
+            print(f"⏳ Status: {status}")
+            if status in ("waiting_files_selection", "waiting_files") and files:
+                print(f"✅ Found {len(files)} files")
+                return files, status
+            elif status in ("downloading", "downloaded", "ready") and files:
+                print(f"✅ Torrent is already downloading or ready (status: {status})")
+                return files, status
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(interval + random.uniform(0, interval * 0.1))
+        interval = min(interval * 2, 10.0)
+    print("⚠️ Timeout waiting for metadata or files.")
+    return None, None
+
+
+def prompt_user_to_select_files(files):
+    # Pull id/name/size out of each dict once; the menu and every retry of
+    # the selection prompt then work from the tuples.
+    display = [
+        (f["id"], f.get("path", f.get("filename", f.get("id"))), f.get("bytes", 0))
+        for f in files
+    ]
+    lines = ["\nAvailable files in torrent:\n"]
+    lines.extend(
+        f"{idx}: {name} ({size * _MB:.2f} MB)"
+        for idx, (_fid, name, size) in enumerate(display, 1)
+    )
+    lines.append("\n0: Select all files")
+    print("\n".join(lines))
+
+    while True:
+        selection_input = input(
+            "\nEnter file numbers to select (e.g. 1,3-5) or leave blank to cancel and delete: "
+        ).strip()
+
+        if selection_input == "0":
+            return [fid for fid, _name, _size in display]
+
+        if selection_input == "":
+            return None
+
+        selected_indexes = parse_selection(selection_input, len(display))
+        if selected_indexes:
+            return [display[i - 1][0] for i in selected_indexes]
+
+        print("❌ Invalid selection. Try again.")
+
+
+
+def wait_for_download_start(torrent_id, max_wait=60):
+    # Same backoff shape as wait_for_metadata: fast first probes for
+    # torrents that start immediately, sparse polls for the rest.
+    interval = 0.5
+    deadline = time.monotonic() + max_wait
+    while True:
+        info = get_torrent_info(torrent_id, fresh=True)
+        if info:
+            status = info.get("status", "")
+            if status in ("downloading", "downloaded", "ready"):
+                print(f"✅ Success: Torrent status is {status}")
+                return True
+            print(f"⏳ Waiting for download to start... (status: {status})")
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(interval + random.uniform(0, interval * 0.1))
+        interval = min(interval * 2, 10.0)
+    print("⚠️ Torrent did not start downloading in time.")
+    return False
+
+# Upload workflows run in parallel but there is only one terminal; prompts
+# take this lock so the user answers one torrent at a time.
+_PROMPT_LOCK = threading.Lock()
+
+def process_torrent_workflow(torrent_path, host=None):
+    attempt = 1
+    tid = None  # Track TID so we can delete if no files selected
+    while attempt <= MAX_RETRIES + 1:
+        if attempt > 1:
+            print(f"\n🔁 Retrying upload (Attempt {attempt} of {MAX_RETRIES + 1})")
+
+        tid = upload_torrent_file(torrent_path, host)
+        if not tid:
+            attempt += 1
+            continue
+
+        files, status = wait_for_metadata(tid)
+        if not files:
+            delete_torrent(tid)
+            attempt += 1
+            continue
+
+        if len(files) == 1:
+            selected_ids = [files[0]["id"]]
+            filename = files[0].get("path", files[0].get("filename", "Unknown"))
+            print(f"✅ Automatically selecting single file: {filename}")
+        else:
+            # serialize prompts so parallel workflows never fight over stdin
+            with _PROMPT_LOCK:
+                print(f"\n📄 {torrent_path}")
+                selected_ids = prompt_user_to_select_files(files)
+ 
+        # choosing to cancel
+        if selected_ids is None:
+            delete_torrent(tid)
+            return False
+
+        # Backup ceck if user selected no files
+        if not selected_ids:
+            delete_torrent(tid)
+            return False
+
+        file_ids = ",".join(map(str, selected_ids))
+        if not select_files(tid, file_ids):
+            delete_torrent(tid)
+            attempt += 1
+            continue
+
+        wait_for_download_start(tid)
+        return True
+
+    print("❌ Unable to process .torrent after multiple attempts. Please try manually.")
+    return False
+
+
+
+# ---------------------------
+# Duplicate Remover
+# ---------------------------
+
+class TorrentRecord:
+    """
+    Minimal per-torrent record kept during the duplicate scan.
+
+    The scan only needs 4 of the ~20 fields RD returns; a slotted object
+    is a fraction of the size of the parsed dict, which matters when every
+    torrent in the account is held in the hash groups at once.
+    """
+    __slots__ = ("id", "filename", "hash", "generated")
+
+    def __init__(self, t):
+        self.id = t.get("id")
+        self.filename = t.get("filename", "Unnamed")
+        self.hash = t.get("hash")
+        self.generated = t.get("generated", 0)
+
+def remove_duplicates():
+    # Prompt user for number of torrents with validation (scripted runs
+    # without a terminal default to checking everything)
+    if not sys.stdin.isatty():
+        limit = None
+    else:
+        while True:
+            choice = input("\nType how many torrents to check for duplicates, or leave blank for all (default): ").strip()
+            if choice == "":
+                limit = None  # all torrents
+                break
+            elif choice.isdigit() and int(choice) > 0:
+                limit = int(choice)
+                break
+            else:
+                print("❌ Invalid input. Please enter a positive number or leave blank for all.")
+
+    # Stream pages straight into the hash groups so the full torrent list is
+    # never materialized (dedupe only reads immutable fields, so cache is
+    # safe). A user-set limit needs the API's ordering, so that path goes
+    # through the ordered list fetch instead.
+    if limit is None:
+        print("🔄 Retrieving all torrents...\n")
+        pages = iter_torrent_pages(use_cache=True)
+    else:
+        pages = [(1, fetch_torrents(limit=limit))]
+
+    # Single pass: keep the oldest torrent per hash, everything else is a dupe.
+    # Tracking the min-by-generated inline avoids sorting the whole list.
+    hash_groups = {}
+    checked = 0
+    for _page, torrents in pages:
+        for t in torrents:
+            checked += 1
+            rec = TorrentRecord(t)
+            if not rec.hash:
+                continue
+            try:
+                # 20-byte keys hash and compare faster than the 40-char hex str
+                thash = bytes.fromhex(rec.hash)
+            except ValueError:
+                thash = rec.hash
+            entry = hash_groups.get(thash)
+            if entry is None:
+                hash_groups[thash] = {"keep": rec, "dupes": []}
+            elif rec.generated < entry["keep"].generated:
+                entry["dupes"].append(entry["keep"])
+                entry["keep"] = rec
+            else:
+                entry["dupes"].append(rec)
+
+    if not checked:
+        print("No torrents fetched.")
+        return
+
+    print(f"\nChecked {checked} torrents for duplicates.\n")
+
+    duplicates = []
+
+    print("🔍 Checking for duplicate torrents...\n")
+    buf = io.StringIO()
+    for thash, entry in hash_groups.items():
+        if entry["dupes"]:
+            keep = entry["keep"]
+            if isinstance(thash, bytes):
+                thash = thash.hex()
+            buf.write(f"Hash: {thash}\n")
+            buf.write(f"  ✅  Kept:    {keep.filename} (ID: {keep.id})\n")
+            for torrent in entry["dupes"]:
+                buf.write(f"  🗑️  Duplicate: {torrent.filename} (ID: {torrent.id})\n")
+                duplicates.append(torrent.id)
+            buf.write("\n")
+    sys.stdout.write(buf.getvalue())
+
+    if not duplicates:
+        print("✅ No duplicates found.")
+        return
+
+    if DRY_RUN:
+        print(f"💡 Dry run: {len(duplicates)} duplicate(s) would be deleted.")
+        return
+
+    if ASSUME_YES:
+        confirm = "y"
+    elif not sys.stdin.isatty():
+        print("❌ No terminal to confirm deletion; re-run with --yes (or --dry-run).")
+        exit(2)
+    else:
+        confirm = input("⚠️ Proceed with deleting these duplicates? (y/N): ").strip().lower()
+    if confirm in ("y", "yes"):
+        deleted = delete_torrents(duplicates)
+        print(f"✅ Deleted {deleted} of {len(duplicates)} duplicates.")
+    else:
+        print("❌ Deletion cancelled.")
+
+
+# ---------------------------
+# Main Run
+# ---------------------------
+def main_menu():
+       
+   # print("\nIf you liked this tool you can support via my referral code next time you renew your sub.\n")
+    
+    if CHECK_PREMIUM:
+        check_user_info()
+    
+    while True:
+        print("\n=== Real-Debrid Toolkit ===")
+
+        print("1. Upload .torrent files")
+        print("2. Check in-progress torrents")
+        print("3. Download torrent files")
+        print("4. Download hoster links")
+        print("5. Find & remove duplicate torrents")
+        print("6. Renew Subscription")
+
+
+        print("0. Exit\n")
+        choice = input("Select an option: ").strip()
+        if choice == "1":
+            upload_torrents()
+        elif choice == "2":
+            in_progress()
+        elif choice == "3":
+            torrent_downloader()
+        elif choice == "4":
+            hoster_downloader()
+        elif choice == "5":  
+            remove_duplicates()
+       # elif choice == "6":
+       #     referal()
+
+        elif choice == "0":
+            url = "http://real-debrid.com/?id=3488563"
+            print("If you liked this tool you can support via my referral code next time you renew your sub.")
+            
+            print(url)
+
+            open_choice = input("Open URL now? (y/N): ").strip().lower()
+            if open_choice == "y":
+                try:
+                    webbrowser.open(url)
+                    print("✅ URL opened in your default browser.")
+                except Exception as e:
+                    print(f"⚠️ Failed to open browser: {e}")
+            exit(0)
+        else:
+            print("Invalid selection. Try again.")
+
+def referal():
+    url = "http://real-debrid.com/?id=3488563"
+    try:
+        webbrowser.open(url)
+        print("✅ URL opened in your default browser.")
+    except Exception as e:
+        print(f"⚠️ Failed to open browser: {e}")
+    exit(0)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Real-Debrid Toolkit")
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="skip confirmation prompts (for scripted runs)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="report what would be deleted without deleting anything")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="run the duplicate remover and exit (no menu)")
+    args = parser.parse_args()
+    ASSUME_YES = args.yes
+    DRY_RUN = args.dry_run
+
+    try:
+        if args.dedupe:
+            remove_duplicates()
+        else:
+            main_menu()
+    except KeyboardInterrupt:
+        print("\nAborted by user.")
+        exit(1)